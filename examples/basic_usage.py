@@ -9,7 +9,7 @@ This module demonstrates the three main ways to use tqdm_rich:
 
 import time
 
-from tqdm_rich import TqdmRich, tqdm, track
+from tqdm_rich import TqdmRich, consume, tqdm, track
 
 
 def example_tqdm_basic():
@@ -198,19 +198,20 @@ def example_different_sizes():
     """
     Example 11: Working with different iterable sizes.
 
-    tqdm automatically adapts to different sizes.
+    tqdm automatically adapts to different sizes. consume() drives each
+    bar without keeping the items around.
     """
     print("Example 11: Different iterable sizes")
     print("-" * 50)
 
     print("Small iteration (10 items):")
-    list(tqdm(range(10), leave=False))
+    consume(tqdm(range(10), leave=False))
 
     print("Medium iteration (50 items):")
-    list(tqdm(range(50), leave=False))
+    consume(tqdm(range(50), leave=False))
 
     print("Large iteration (100 items):")
-    list(tqdm(range(100), leave=False))
+    consume(tqdm(range(100), leave=False))
 
     print("✓ Completed\n")
 
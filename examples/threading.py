@@ -5,10 +5,13 @@ This module demonstrates how tqdm_rich handles concurrent progress tracking
 across multiple threads safely.
 """
 
+import itertools
+import queue
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from tqdm_rich import tqdm, track
+from tqdm_rich import consume, tqdm, track
 
 
 def example_simple_threading():
@@ -46,26 +49,27 @@ def example_producer_consumer():
     print("Example 2: Producer-consumer pattern")
     print("-" * 50)
 
-    items = []
-    items_lock = threading.Lock()
+    total_items = 50
+    items = queue.SimpleQueue()
+
+    # Items left to consume; next() on itertools.count is atomic, so
+    # counting down needs no lock
+    remaining = itertools.count(total_items - 1, -1)
+    done = threading.Event()
 
     def producer():
-        for i in tqdm(range(50), desc="Producing"):
+        for i in tqdm(range(total_items), desc="Producing"):
             time.sleep(0.01)
-            with items_lock:
-                items.append(i)
+            items.put(i)
 
     def consumer():
-        processed = 0
-        while processed < 50:
-            with items_lock:
-                if items:
-                    items.pop(0)
-                    processed += 1
-            time.sleep(0.01)
+        while not done.is_set():
+            items.get()
+            if next(remaining) == 0:
+                done.set()
 
         # Show completion
-        for _ in tqdm(range(50), desc="Consuming"):
+        for _ in tqdm(range(total_items), desc="Consuming"):
             pass
 
     prod_thread = threading.Thread(target=producer)
@@ -99,16 +103,14 @@ def example_thread_pool_simulation():
     num_workers = 4
     tasks_per_worker = 25
 
-    threads = [
-        threading.Thread(target=task_worker, args=(i, tasks_per_worker))
-        for i in range(num_workers)
-    ]
-
-    for t in threads:
-        t.start()
-
-    for t in threads:
-        t.join()
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        consume(
+            executor.map(
+                task_worker,
+                range(num_workers),
+                [tasks_per_worker] * num_workers,
+            )
+        )
 
     print(
         f"✓ {num_workers} workers completed {num_workers * tasks_per_worker} tasks\n"
@@ -124,16 +126,15 @@ def example_synchronized_progress():
     print("Example 4: Synchronized progress")
     print("-" * 50)
 
-    shared_progress = {"completed": 0}
-    progress_lock = threading.Lock()
+    # next() on itertools.count is atomic, so no lock is needed
+    shared_counter = itertools.count(1)
     total_items = 100
 
     def synchronized_worker(worker_id):
         local_items = list(range(25))
         for item in tqdm(local_items, desc=f"Worker {worker_id}", leave=False):
             time.sleep(0.01)
-            with progress_lock:
-                shared_progress["completed"] += 1
+            next(shared_counter)
 
     threads = [
         threading.Thread(target=synchronized_worker, args=(i,))
@@ -146,7 +147,8 @@ def example_synchronized_progress():
     for t in threads:
         t.join()
 
-    print(f"✓ Total completed: {shared_progress['completed']}/{total_items}\n")
+    completed = next(shared_counter) - 1
+    print(f"✓ Total completed: {completed}/{total_items}\n")
 
 
 def example_parallel_file_processing():
@@ -158,36 +160,37 @@ def example_parallel_file_processing():
     print("Example 5: Parallel file processing")
     print("-" * 50)
 
-    files = [f"file_{i}.txt" for i in range(20)]
-    files_lock = threading.Lock()
+    files = queue.Queue()
+    for i in range(20):
+        files.put(f"file_{i}.txt")
+    batch_size = 5
 
     def process_file(worker_id):
         processed = []
         while True:
-            with files_lock:
-                if not files:
+            # Grab several files per trip to the shared queue
+            batch = []
+            for _ in range(batch_size):
+                try:
+                    batch.append(files.get_nowait())
+                except queue.Empty:
                     break
-                file_name = files.pop(0)
+            if not batch:
+                break
 
-            # Simulate file processing
-            for _ in tqdm(
-                range(10), desc=f"Processing {file_name}", leave=False
-            ):
-                time.sleep(0.01)
+            for file_name in batch:
+                # Simulate file processing
+                for _ in tqdm(
+                    range(10), desc=f"Processing {file_name}", leave=False
+                ):
+                    time.sleep(0.01)
 
-            processed.append(file_name)
+                processed.append(file_name)
 
         print(f"  Worker {worker_id}: Processed {len(processed)} files")
 
-    threads = [
-        threading.Thread(target=process_file, args=(i,)) for i in range(4)
-    ]
-
-    for t in threads:
-        t.start()
-
-    for t in threads:
-        t.join()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        consume(executor.map(process_file, range(4)))
 
     print("✓ All files processed\n")
 
@@ -229,17 +232,10 @@ def example_stress_test():
         for _ in tqdm(range(50), desc=f"Stress {worker_id}", leave=False):
             time.sleep(0.005)
 
-    threads = [
-        threading.Thread(target=stress_worker, args=(i,)) for i in range(10)
-    ]
-
     start_time = time.time()
 
-    for t in threads:
-        t.start()
-
-    for t in threads:
-        t.join()
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        consume(executor.map(stress_worker, range(10)))
 
     elapsed = time.time() - start_time
     print(f"✓ Stress test completed in {elapsed:.2f}s\n")
@@ -26,26 +26,36 @@ Example:
 
 from __future__ import annotations
 
+import operator
+import os
 import threading
-from collections.abc import Generator, Iterable
-from typing import Any, Optional, TypeVar, Union
-
-from rich.console import RenderableType
+import time
+import weakref
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from rich import get_console
+from rich.console import Console, JustifyMethod, RenderableType
 from rich.progress import (
     BarColumn,
     Progress,
     SpinnerColumn,
     Task,
+    TaskID,
     TaskProgressColumn,
     TextColumn,
     TimeElapsedColumn,
     TimeRemainingColumn,
 )
 from rich.progress_bar import ProgressBar
+from rich.style import StyleType
+from rich.text import Text
 
 __version__ = "0.1.1"
 __author__ = "DawnMagnet"
-__all__ = ["tqdm", "track", "TqdmRich"]
+__all__ = ["tqdm", "track", "TqdmRich", "consume"]
 
 T = TypeVar("T")
 
@@ -54,6 +64,12 @@ _COLOR_RUNNING = "white"
 _COLOR_SUCCESS = "green"
 _COLOR_ERROR = "red"
 
+# Seconds between two refreshes of the shared progress display
+_REFRESH_INTERVAL = 0.1
+
+# TQDM_RICH_NOOP=1 turns every bar into a plain pass-through, e.g. for test runs
+_NOOP = os.environ.get("TQDM_RICH_NOOP", "") not in ("", "0")
+
 
 class DynamicBarColumn(BarColumn):
     """
@@ -94,6 +110,102 @@ class DynamicBarColumn(BarColumn):
         )
 
 
+@lru_cache(maxsize=256)
+def _parse_markup(markup: str, style: StyleType, justify: JustifyMethod) -> Text:
+    """
+    Parse console markup into a Text, memoized on the markup string.
+
+    Descriptions rarely change while a bar is running, so caching the parse
+    saves re-scanning the same markup on every refresh. The result is
+    shared between callers: copy it before modifying it.
+
+    Args:
+        markup: The markup string to parse
+        style: Base style applied to the text
+        justify: Justification of the text
+
+    Returns:
+        The parsed Text (shared, do not mutate)
+    """
+    return Text.from_markup(markup, style=style, justify=justify)
+
+
+class CachedTextColumn(TextColumn):
+    """
+    Text column that memoizes markup parsing across refreshes.
+
+    Rich's TextColumn parses the formatted markup of every task on every
+    refresh. This column reuses the parse result for markup it has already
+    seen, which is the common case for progress bar descriptions.
+
+    The same Text instance is returned for every refresh of an unchanged
+    description. Rich never modifies a Text while rendering it, so it is
+    only copied when a highlighter needs to restyle it.
+    """
+
+    def render(self, task: Task) -> Text:
+        """
+        Render the column text for a task.
+
+        Args:
+            task: The progress task to render
+
+        Returns:
+            A Text renderable for the task
+        """
+        if not self.markup:
+            return super().render(task)
+
+        markup = self.text_format.format(task=task)
+        text = _parse_markup(markup, self.style, self.justify)
+        if self.highlighter:
+            text = text.copy()
+            self.highlighter.highlight(text)
+        return text
+
+
+class _AtomicCounter:
+    """
+    Lock-free counter for progress increments, sharded per thread.
+
+    Each thread that calls ``add()`` gets its own one-element cell and is
+    the only writer of that cell, so increments never race and never share
+    a counter with other threads. Readers sum all cells.
+
+    Thread Safety:
+        Neither ``add()`` nor ``value`` takes a lock. Cells of threads that
+        have exited are kept so their increments still count.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the counter at zero."""
+        self._cells: List[List[int]] = []
+        self._local = threading.local()
+
+    def add(self, n: int = 1) -> None:
+        """
+        Add ``n`` to the calling thread's cell without taking a lock.
+
+        Args:
+            n: Amount to add
+        """
+        try:
+            self._local.cell[0] += n
+        except AttributeError:
+            self._local.cell = [n]
+            self._cells.append(self._local.cell)
+
+    @property
+    def value(self) -> int:
+        """
+        Current value of the counter.
+
+        Returns:
+            The sum of all increments added so far
+        """
+        return sum(cell[0] for cell in self._cells)
+
+
 class _ProgressManager:
     """
     Thread-safe singleton manager for Rich Progress instances.
@@ -102,8 +214,15 @@ class _ProgressManager:
     coordinating multiple concurrent progress tasks. It uses reference counting
     to determine when to start and stop the underlying Progress instance.
 
+    While any task is active, a single daemon render thread periodically
+    samples the progress of the watched tasks into Rich and refreshes the
+    display, so worker threads never call into Rich while iterating.
+
     Thread Safety:
-        All operations are protected by an RLock to ensure thread safety.
+        Task bookkeeping is protected by an RLock. Watching a task is a
+        single dict store and takes no lock, so registering a bar never
+        waits for a render pass. Unwatching waits for the render pass in
+        flight so the task is not touched afterwards.
     """
 
     def __init__(self) -> None:
@@ -111,13 +230,24 @@ class _ProgressManager:
         self._lock = threading.RLock()
         self._active_count = 0
         self._progress: Optional[Progress] = None
+        self._render_lock = threading.RLock()
+        # Task ids restart from 0 for every Progress, so tasks are keyed by
+        # the Progress they belong to as well
+        self._sources: Dict[Tuple[Progress, TaskID], weakref.WeakMethod[Callable[[], float]]] = {}
+        # Last count pushed into each watched task by the render thread
+        self._last_rendered: Dict[Tuple[Progress, TaskID], float] = {}
+        self._render_thread: Optional[threading.Thread] = None
+        self._render_stop = threading.Event()
+        self._frame_time: Optional[float] = None
+        self._retired: deque[Tuple[Progress, TaskID]] = deque()
 
     def get_progress(self) -> Progress:
         """
         Get or create the global Progress instance.
 
         Thread-safe operation that either returns an existing Progress instance
-        or creates a new one with standard columns.
+        or creates a new one with standard columns. Auto-refresh is disabled
+        because the render thread drives the display.
 
         Returns:
             The shared Progress instance
@@ -126,23 +256,34 @@ class _ProgressManager:
             if self._progress is None:
                 self._progress = Progress(
                     SpinnerColumn(style=_COLOR_RUNNING),
-                    TextColumn("{task.description}", justify="right"),
+                    CachedTextColumn("{task.description}", justify="right"),
                     DynamicBarColumn(bar_width=None),
                     TaskProgressColumn(),
                     "•",
                     TimeElapsedColumn(),
                     "•",
                     TimeRemainingColumn(),
+                    console=self._make_console(),
+                    auto_refresh=False,
                     transient=False,
+                    get_time=self._get_time,
                 )
             return self._progress
 
+    def _make_console(self) -> Console:
+        """
+        Return the Console the shared Progress renders to.
+
+        Defaults to Rich's global console; override it to render elsewhere.
+        """
+        return get_console()
+
     def start_task(self) -> Progress:
         """
         Start a new task, initializing the Progress instance if needed.
 
         Uses reference counting to track active tasks. The Progress instance
-        is only started when the first task begins.
+        and the render thread are only started when the first task begins.
 
         Returns:
             The Progress instance
@@ -151,6 +292,7 @@ class _ProgressManager:
             p = self.get_progress()
             if self._active_count == 0:
                 p.start()
+                self._start_render_thread(p)
             self._active_count += 1
             return p
 
@@ -158,16 +300,187 @@ class _ProgressManager:
         """
         Stop a task and clean up if no more tasks are active.
 
-        When the last task stops, the Progress instance is stopped and
-        reset for future use.
+        When the last task stops, the render thread is stopped and the
+        Progress instance is stopped and reset for future use.
         """
         with self._lock:
             self._active_count -= 1
             if self._active_count <= 0 and self._progress:
+                self._stop_render_thread()
+                self._remove_retired(self._progress)
                 self._progress.stop()
                 self._progress = None
                 self._active_count = 0
 
+    def watch(self, progress: Progress, task_id: TaskID, source: Callable[[], float]) -> None:
+        """
+        Let the render thread copy the value of ``source`` into the given task.
+
+        Only a weak reference to ``source`` is kept, so a bar that is
+        abandoned mid-iteration can still be garbage collected and close
+        its task.
+
+        Args:
+            progress: The Progress instance owning the task
+            task_id: The Rich task to keep in sync
+            source: Bound method returning the task's completed count
+        """
+        self._sources[progress, task_id] = weakref.WeakMethod(source)
+
+    def unwatch(self, progress: Progress, task_id: TaskID) -> None:
+        """
+        Stop syncing a task from the render thread.
+
+        Once this returns, the render thread will not touch the task again,
+        so the caller can safely apply its final state. Unwatching a task of
+        a Progress that has since been replaced is a no-op, even if a task
+        of the new Progress has the same id.
+
+        Args:
+            progress: The Progress instance owning the task
+            task_id: The Rich task to stop syncing
+        """
+        with self._render_lock:
+            self._sources.pop((progress, task_id), None)
+            self._last_rendered.pop((progress, task_id), None)
+
+    def resync(self, progress: Progress, task_id: TaskID) -> None:
+        """
+        Make the next render pass update a task even if its count looks unchanged.
+
+        Needed after the task was changed behind the render thread's back,
+        e.g. by ``Progress.reset()``.
+
+        Args:
+            progress: The Progress instance owning the task
+            task_id: The Rich task to update on the next pass
+        """
+        with self._render_lock:
+            self._last_rendered.pop((progress, task_id), None)
+
+    def retire(self, progress: Progress, task_id: TaskID) -> None:
+        """
+        Remove a finished task from the display on the next render pass.
+
+        Removals requested between two frames are applied together right
+        before the frame is drawn, so closing many bars costs one redraw.
+
+        Args:
+            progress: The Progress instance owning the task
+            task_id: The Rich task to remove
+        """
+        self._retired.append((progress, task_id))
+
+    def _remove_retired(self, progress: Progress) -> None:
+        """Remove all retired tasks from ``progress``."""
+        retired = self._retired
+        while retired:
+            owner, task_id = retired.popleft()
+            # Tasks of a Progress that was already stopped went away with it
+            if owner is progress:
+                progress.remove_task(task_id)
+
+    def _get_time(self) -> float:
+        """
+        Clock used by Rich for elapsed time, speed and animations.
+
+        During a render pass this returns the timestamp taken at the start
+        of the pass, so rendering all columns of all tasks reads the system
+        clock once per frame instead of several times per task.
+
+        Returns:
+            The current time in seconds
+        """
+        frame_time = self._frame_time
+        return time.monotonic() if frame_time is None else frame_time
+
+    def _start_render_thread(self, progress: Progress) -> None:
+        """Spawn the daemon thread rendering ``progress``."""
+        self._render_stop = threading.Event()
+        self._render_thread = threading.Thread(
+            target=self._render_loop,
+            args=(progress, self._render_stop),
+            name="tqdm-rich-render",
+            daemon=True,
+        )
+        self._render_thread.start()
+
+    def _stop_render_thread(self) -> None:
+        """Signal the render thread to exit and wait for it."""
+        self._render_stop.set()
+        if self._render_thread is not None:
+            # A bar finalized by the garbage collector may end up stopping
+            # the render thread from within the render thread itself
+            if self._render_thread is not threading.current_thread():
+                self._render_thread.join()
+            self._render_thread = None
+
+    def _render_loop(self, progress: Progress, stop: threading.Event) -> None:
+        """
+        Refresh ``progress`` every ``_REFRESH_INTERVAL`` until ``stop`` is set.
+
+        Sources are sampled once per tick, so any number of updates between
+        two ticks costs a single Rich update. Tasks whose count has not
+        moved since the previous tick are not updated at all.
+
+        Args:
+            progress: The Progress instance to render
+            stop: Event signalling the loop to exit
+        """
+        last_rendered = self._last_rendered
+        while not stop.wait(_REFRESH_INTERVAL):
+            self._frame_time = time.monotonic()
+            self._remove_retired(progress)
+            with self._render_lock:
+                for key, ref in self._sources.copy().items():
+                    source = ref()
+                    if source is None or key[0] is not progress:
+                        continue
+                    completed = source()
+                    if last_rendered.get(key) != completed:
+                        progress.update(key[1], completed=completed)
+                        last_rendered[key] = completed
+            if not stop.is_set():
+                progress.refresh()
+            self._frame_time = None
+
+
+class _TrackProgress:
+    """
+    Item count of a running track() call, sampled by the render thread.
+
+    The generator driving track() is the only writer of ``count``, so it is
+    updated with a plain store. ``completed()`` converts it to the value
+    shown by the bar, applying the logarithmic scale when enabled.
+
+    Attributes:
+        count: Number of items consumed so far
+        log_step_factor: Logarithmic scale factor, or None for linear mode
+    """
+
+    def __init__(self, log_step_factor: Optional[float] = None) -> None:
+        """
+        Initialize the progress state at zero items.
+
+        Args:
+            log_step_factor: Logarithmic scale factor, or None for linear mode
+        """
+        self.count = 0
+        self.log_step_factor = log_step_factor
+
+    def completed(self) -> float:
+        """
+        Return the completed value to display for the current count.
+
+        Returns:
+            The item count in linear mode, or a fraction approaching 0.99
+            asymptotically in logarithmic mode
+        """
+        if self.log_step_factor is None:
+            return self.count
+        percentage: float = 1.0 - (0.2 ** (self.count / self.log_step_factor))
+        return min(percentage, 0.99)
+
 
 # Global progress manager instance
 _manager = _ProgressManager()
@@ -210,6 +523,10 @@ def track(
         ...     # Do something with item
         ...     pass
     """
+    if _NOOP:
+        yield from sequence
+        return
+
     # Determine the total count and mode
     is_log_mode = False
     if total is None:
@@ -239,21 +556,15 @@ def track(
         bar_style=_COLOR_RUNNING,
     )
 
+    # Let the render thread push the progress into Rich
+    state = _TrackProgress(log_step_factor if is_log_mode else None)
+    _manager.watch(progress, task_id, state.completed)
+
     success = False
     try:
-        current_step = 0
-        for item in sequence:
+        for n, item in enumerate(sequence, 1):
             yield item
-
-            # Update progress bar
-            if is_log_mode:
-                # Logarithmic progress: approaches 1.0 asymptotically
-                current_step += 1
-                percentage = 1.0 - (0.2 ** (current_step / log_step_factor))
-                progress.update(task_id, completed=min(percentage, 0.99))
-            else:
-                # Linear progress: increment by 1
-                progress.update(task_id, advance=1)
+            state.count = n
 
         # Mark successful completion
         success = True
@@ -269,7 +580,11 @@ def track(
 
     finally:
         # Final state handling
-        if success:
+        _manager.unwatch(progress, task_id)
+        if transient:
+            # The bar is about to disappear, so skip recoloring it
+            _manager.retire(progress, task_id)
+        elif success:
             # Success: turn green and fill the bar
             progress.update(
                 task_id,
@@ -283,12 +598,9 @@ def track(
                 task_id,
                 bar_style=_COLOR_ERROR,
                 description=f"[{_COLOR_ERROR}]{description}",
+                completed=state.completed(),
             )
 
-        # Remove the task if transient mode is enabled
-        if transient:
-            progress.remove_task(task_id)
-
         _manager.stop_task()
 
 
@@ -308,6 +620,13 @@ class TqdmRich:
         file: Output file (ignored, for tqdm compatibility)
         colour: Color to use (stored but overridden by state-based coloring)
 
+    Thread Safety:
+        Iterating a bar takes no lock per item: the iterating thread is the
+        only writer of the item count and publishes it with a plain store.
+        ``update()`` may be called from any thread and goes through a
+        per-thread sharded counter. Locks are only taken when the bar
+        starts and finishes.
+
     Example:
         >>> bar = TqdmRich(range(100), desc="Processing")
         >>> for item in bar:
@@ -348,7 +667,8 @@ class TqdmRich:
             maxinterval: Maximum update interval (ignored, for compatibility)
             miniters: Minimum iterations between updates (ignored)
             ascii: ASCII mode (ignored, for compatibility)
-            disable: If True, disable the progress bar
+            disable: If True, disable the progress bar (always True when the
+                TQDM_RICH_NOOP environment variable is set)
             unit: Unit name (default: "it" for iterations)
             unit_scale: If True, scale large numbers (ignored)
             colour: Color name (overridden by state-based coloring)
@@ -359,7 +679,7 @@ class TqdmRich:
         self.desc = desc or "Processing"
         self.total = total
         self.leave = leave
-        self.disable = disable
+        self.disable = disable or _NOOP
         self.unit = unit
         self.colour = colour
         self.position = position or 0
@@ -374,20 +694,26 @@ class TqdmRich:
         self.unit_scale = unit_scale
 
         # Initialize internal state
-        self._iterator: Optional[Generator[T, None, None]] = None
+        self._iterator: Optional[Iterator[T]] = None
         self._progress: Optional[Progress] = None
-        self._task_id: Optional[int] = None
-        self._completed = 0
-
-    def __iter__(self) -> Generator[T, None, None]:  # type: ignore[override]
+        self._task_id: Optional[TaskID] = None
+        self._completed = _AtomicCounter()
+        self._iterated = 0
+        self._range_iterator: Optional[Iterator[int]] = None
+        self._range_size = 0
+        self._total: Optional[int] = None
+        self._iterating = False
+
+    def __iter__(self) -> Iterator[T]:
         """Start iteration over the wrapped iterable."""
         if self.disable:
-            # If disabled, just iterate without progress
-            if self.iterable is not None:
-                yield from self.iterable  # type: ignore[misc]
-            return
+            # If disabled, hand out the wrapped iterator itself so that
+            # iterating costs exactly as much as without a progress bar
+            return iter(self.iterable if self.iterable is not None else ())  # type: ignore[arg-type]
+        return self._iterate()
 
-        # Create the iterator
+    def _iterate(self) -> Generator[T, None, None]:
+        """Iterate over the wrapped iterable while displaying progress."""
         if self.iterable is None:
             return
 
@@ -395,8 +721,10 @@ class TqdmRich:
         total = self.total
         if total is None and hasattr(self.iterable, "__len__"):
             total = len(self.iterable)  # type: ignore[arg-type]
+        # Kept on the bar so that reset() can replace it mid-iteration
+        self._total = total
 
-        # Start progress tracking
+        # Start progress tracking; the render thread keeps the task in sync
         self._progress = _manager.start_task()
         self._task_id = self._progress.add_task(
             f"[{_COLOR_RUNNING}]{self.desc}",
@@ -404,19 +732,31 @@ class TqdmRich:
             start=True,
             bar_style=_COLOR_RUNNING,
         )
+        _manager.watch(self._progress, self._task_id, self._count)
+        self._iterating = True
 
+        # A generator is only ever advanced by one thread at a time, so the
+        # item count is bumped in place rather than through the atomic counter
+        self._iterated = 0
+        self._range_iterator = None
         success = False
         try:
-            for item in self.iterable:
-                self._completed += 1
-                yield item  # type: ignore[misc]
-
-                # Update progress
-                if self._task_id is not None:
-                    self._progress.update(
-                        self._task_id,
-                        advance=1,
-                    )
+            if isinstance(self.iterable, range):
+                # Fast path: delegate to the range iterator in C and derive
+                # the count from how many items it has left
+                self._range_size = len(self.iterable)
+                self._range_iterator = iter(self.iterable)
+                yield from self._range_iterator  # type: ignore[misc]
+                # Stop the render thread sampling before moving the count
+                # from the iterator to _iterated, so it never sees a
+                # half-done handover
+                _manager.unwatch(self._progress, self._task_id)
+                self._range_iterator = None
+                self._iterated += self._range_size
+            else:
+                for item in self.iterable:
+                    yield item  # type: ignore[misc]
+                    self._iterated += 1
 
             success = True
 
@@ -432,25 +772,28 @@ class TqdmRich:
 
         finally:
             # Final state
+            self._iterating = False
             if self._task_id is not None:
-                if success:
+                _manager.unwatch(self._progress, self._task_id)
+                if not self.leave:
+                    # The bar is about to disappear, so skip recoloring it
+                    _manager.retire(self._progress, self._task_id)
+                    self._task_id = None
+                elif success:
                     self._progress.update(
                         self._task_id,
                         bar_style=_COLOR_SUCCESS,
                         description=f"[{_COLOR_SUCCESS}]{self.desc}",
-                        completed=total or self._completed,
+                        completed=self._total or self._count(),
                     )
                 else:
                     self._progress.update(
                         self._task_id,
                         bar_style=_COLOR_ERROR,
                         description=f"[{_COLOR_ERROR}]{self.desc}",
+                        completed=self._count(),
                     )
 
-                # Remove if not leaving
-                if not self.leave:
-                    self._progress.remove_task(self._task_id)
-
             _manager.stop_task()
 
     def __next__(self) -> T:  # type: ignore[misc,return-value,type-var]
@@ -463,24 +806,74 @@ class TqdmRich:
         """
         Update the progress bar.
 
+        Only the bar's counter is touched; the render thread picks up the
+        new value on its next refresh.
+
         Args:
             n: Number of items to advance the progress bar by
         """
+        self._completed.add(n)
+
+    def _items_done(self) -> int:
+        """Return the number of items the caller has finished processing."""
+        done = self._iterated
+        iterator = self._range_iterator
+        if iterator is not None:
+            # The last item handed out is still being processed
+            handed_out = self._range_size - operator.length_hint(iterator)
+            done += max(handed_out - 1, 0)
+        return done
+
+    def _count(self) -> int:
+        """Return the number of items iterated plus manual updates."""
+        return self._items_done() + self._completed.value
+
+    def reset(self, total: Optional[int] = None) -> None:
+        """
+        Reset the progress bar to zero so it can be reused.
+
+        Like tqdm's ``reset()``, this keeps the bar (and its Rich task, if
+        it is displayed) instead of creating a new one.
+
+        Args:
+            total: New total to use (keeps the current total if None)
+        """
+        self._completed = _AtomicCounter()
+        self._iterated -= self._items_done()
+        if total is not None:
+            self.total = total
+            self._total = total
+
         if self._task_id is not None and self._progress is not None:
-            self._progress.update(self._task_id, advance=n)  # type: ignore[arg-type]
-            self._completed += n
+            self._progress.reset(
+                self._task_id,
+                total=total,
+                completed=0,
+                bar_style=_COLOR_RUNNING,
+                description=f"[{_COLOR_RUNNING}]{self.desc}",
+            )
+            _manager.resync(self._progress, self._task_id)
 
     def close(self) -> None:
-        """Close the progress bar."""
+        """
+        Close the progress bar.
+
+        A bar closed mid-iteration is finalized with its current count. Once
+        iteration has finished the task already shows its final state, so it
+        is left as is.
+        """
         if self._task_id is not None and self._progress is not None:
-            if self.leave:
-                self._progress.update(
-                    self._task_id,  # type: ignore[arg-type]
-                    bar_style=_COLOR_SUCCESS,
-                    description=f"[{_COLOR_SUCCESS}]{self.desc}",
-                )
-            else:
-                self._progress.remove_task(self._task_id)  # type: ignore[arg-type]
+            if self._iterating:
+                _manager.unwatch(self._progress, self._task_id)
+                if self.leave:
+                    self._progress.update(
+                        self._task_id,
+                        bar_style=_COLOR_SUCCESS,
+                        description=f"[{_COLOR_SUCCESS}]{self.desc}",
+                        completed=self._count(),
+                    )
+                else:
+                    _manager.retire(self._progress, self._task_id)
             self._task_id = None
 
     def __enter__(self) -> "TqdmRich":
@@ -528,3 +921,20 @@ def tqdm(  # type: ignore[misc,type-var]
         leave=leave,
         **kwargs,
     )
+
+
+def consume(iterable: Iterable[Any]) -> None:
+    """
+    Run an iterable to completion, discarding its items.
+
+    Useful to drive a progress bar when only the side effects matter,
+    without building a list of the results as ``list(tqdm(...))`` does.
+
+    Args:
+        iterable: The iterable to exhaust, typically a progress bar
+
+    Example:
+        >>> from tqdm_rich import consume, tqdm
+        >>> consume(tqdm(range(100), leave=False))
+    """
+    deque(iterable, maxlen=0)
@@ -2,10 +2,46 @@
 Pytest configuration and fixtures for tqdm_rich tests.
 """
 
+import os
 import time
-from typing import Generator
+from typing import Generator, Iterator, List, Tuple
 
 import pytest
+from rich.console import Console
+
+import tqdm_rich
+
+
+@pytest.fixture(autouse=True, scope="session")
+def shared_console() -> Iterator[Console]:
+    """
+    One Console, writing to the null device, for every bar in the session.
+
+    The shared Progress is built with this Console, so tests still exercise
+    the full rendering path without terminal probing, terminal I/O, or
+    escape sequences filling pytest's capture buffers.
+
+    Yields:
+        The Console all progress bars render to
+    """
+    with open(os.devnull, "w") as devnull:
+        console = Console(file=devnull, force_terminal=False, width=80)
+        mp = pytest.MonkeyPatch()
+        mp.setattr(tqdm_rich._ProgressManager, "_make_console", lambda self: console)
+        yield console
+        mp.undo()
+
+
+@pytest.fixture(autouse=True)
+def _rich_render(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Keep real progress bars for tests marked ``rich_render``.
+
+    Those tests inspect the Rich tasks a bar drives, so they opt out of the
+    pass-through mode enabled by the TQDM_RICH_NOOP environment variable.
+    """
+    if request.node.get_closest_marker("rich_render") is not None:
+        monkeypatch.setattr(tqdm_rich, "_NOOP", False)
 
 
 @pytest.fixture
@@ -21,12 +57,72 @@ def slow_iterable() -> Generator[int, None, None]:
         yield i
 
 
-@pytest.fixture
-def fast_iterable():
+@pytest.fixture(scope="session")
+def fast_iterable() -> Tuple[int, ...]:
     """
-    A fast iterable for quick tests.
+    A fast iterable for quick tests, shared across the session.
 
     Returns:
-        Range of 100 numbers
+        Tuple of 100 numbers (immutable, so tests cannot alter it)
+    """
+    return tuple(range(100))
+
+
+@pytest.fixture(scope="session")
+def big_range() -> Tuple[int, ...]:
+    """
+    A large iterable for tests that break out early, shared across the session.
+
+    Returns:
+        Tuple of 10000 numbers (immutable, so tests cannot alter it)
+    """
+    return tuple(range(10000))
+
+
+@pytest.fixture
+def fresh_bar() -> Iterator[tqdm_rich.TqdmRich]:
+    """
+    A disabled manual bar for tests that only exercise update().
+
+    Yields:
+        TqdmRich with a total of 100, closed after the test
+    """
+    bar = tqdm_rich.TqdmRich(total=100, disable=True)
+    yield bar
+    bar.close()
+
+
+@pytest.fixture
+def fresh_bar_no_total() -> Iterator[tqdm_rich.TqdmRich]:
+    """
+    A disabled manual bar without a total.
+
+    Yields:
+        TqdmRich with no total, closed after the test
+    """
+    bar = tqdm_rich.TqdmRich(disable=True)
+    yield bar
+    bar.close()
+
+
+@pytest.fixture
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Turn time.sleep() into a no-op for the duration of a test.
+
+    Meant for tests that only sleep to simulate work, so that their runtime
+    reflects the progress bar rather than the scheduler.
+    """
+    monkeypatch.setattr(time, "sleep", lambda *_: None)
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """
+    Run the logic-only ``noop`` tests before everything else.
+
+    Under TQDM_RICH_NOOP those tests render nothing, so the tests that drive
+    real Rich progress bars form one contiguous block after them. In a plain
+    run every test renders and the sort only changes the order. It is
+    stable, so the order within each block is unchanged.
     """
-    return range(100)
+    items.sort(key=lambda item: item.get_closest_marker("noop") is None)
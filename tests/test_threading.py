@@ -8,10 +8,16 @@ This test suite covers:
 - Lock behavior and race conditions
 """
 
+import gc
 import threading
 import time
 
-from tqdm_rich import TqdmRich, tqdm, track
+import pytest
+
+import tqdm_rich
+from tqdm_rich import TqdmRich, consume, tqdm, track
+
+_R1, _R5, _R10, _R20, _R100 = range(1), range(5), range(10), range(20), range(100)
 
 
 class TestThreadSafety:
@@ -19,8 +25,8 @@ class TestThreadSafety:
 
     def test_single_thread(self):
         """Test basic single-threaded operation."""
-        items = list(tqdm(range(50), desc="Single"))
-        assert len(items) == 50
+        count = sum(1 for _ in tqdm(range(50), desc="Single"))
+        assert count == 50
 
     def test_multiple_threads_sequential(self):
         """Test multiple threads using tqdm sequentially."""
@@ -28,7 +34,7 @@ class TestThreadSafety:
 
         def worker(worker_id):
             items = []
-            for item in tqdm(range(10), desc=f"Worker {worker_id}"):
+            for item in tqdm(_R10, desc=f"Worker {worker_id}"):
                 items.append(item)
             results.append(items)
 
@@ -48,7 +54,7 @@ class TestThreadSafety:
 
         def worker(worker_id):
             items = 0
-            for item in tqdm(range(20), desc=f"Task {worker_id}", leave=False):
+            for item in tqdm(_R20, desc=f"Task {worker_id}", leave=False):
                 items += 1
             with lock:
                 completed_count[0] += 1
@@ -86,11 +92,11 @@ class TestMultipleProgressBars:
     def test_two_sequential_progress_bars(self):
         """Test two progress bars running sequentially."""
         count1 = 0
-        for _ in tqdm(range(20), desc="First"):
+        for _ in tqdm(_R20, desc="First"):
             count1 += 1
 
         count2 = 0
-        for _ in tqdm(range(20), desc="Second"):
+        for _ in tqdm(_R20, desc="Second"):
             count2 += 1
 
         assert count1 == 20
@@ -99,8 +105,8 @@ class TestMultipleProgressBars:
     def test_nested_progress_bars(self):
         """Test nested progress bars."""
         count = 0
-        for i in tqdm(range(5), desc="Outer"):
-            for j in tqdm(range(5), desc="Inner", leave=False):
+        for i in tqdm(_R5, desc="Outer"):
+            for j in tqdm(_R5, desc="Inner", leave=False):
                 count += 1
 
         assert count == 25
@@ -110,8 +116,7 @@ class TestMultipleProgressBars:
         results = []
 
         def task(size):
-            items = list(tqdm(range(size), leave=False))
-            results.append(len(items))
+            results.append(sum(1 for _ in tqdm(range(size), leave=False)))
 
         threads = [
             threading.Thread(target=task, args=(10,)),
@@ -124,13 +129,13 @@ class TestMultipleProgressBars:
         for t in threads:
             t.join()
 
-        assert results == [10, 20, 30]
+        assert sorted(results) == [10, 20, 30]
 
 
 class TestConcurrentUpdates:
     """Test concurrent update operations."""
 
-    def test_concurrent_manual_updates(self):
+    def test_concurrent_manual_updates(self, no_sleep):
         """Test concurrent manual updates."""
         bar = TqdmRich(total=100)
 
@@ -147,7 +152,24 @@ class TestConcurrentUpdates:
 
         bar.close()
 
-    def test_concurrent_track_updates(self):
+    def test_concurrent_updates_are_not_lost(self):
+        """Test that no increment is lost under concurrent updates."""
+        bar = TqdmRich(total=4000)
+
+        def updater():
+            for _ in range(1000):
+                bar.update(1)
+
+        threads = [threading.Thread(target=updater) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert bar._completed.value == 4000
+        bar.close()
+
+    def test_concurrent_track_updates(self, no_sleep):
         """Test concurrent track with updates."""
 
         def worker(worker_id):
@@ -171,8 +193,8 @@ class TestThreadSafeNestedCalls:
 
         def worker():
             count = 0
-            for i in tqdm(range(5), desc="Outer", leave=False):
-                for j in tqdm(range(5), desc="Inner", leave=False):
+            for i in tqdm(_R5, desc="Outer", leave=False):
+                for j in tqdm(_R5, desc="Inner", leave=False):
                     count += 1
             results.append(count)
 
@@ -212,14 +234,14 @@ class TestRaceConditions:
     def test_rapid_start_stop(self):
         """Test rapid creation and destruction of progress bars."""
         for _ in range(10):
-            bar = tqdm(range(10), leave=False)
+            bar = tqdm(_R10, leave=False)
             list(bar)
 
     def test_rapid_multiple_threads(self):
         """Test rapid concurrent creation."""
 
         def quick_task():
-            list(tqdm(range(5), leave=False))
+            list(tqdm(_R5, leave=False))
 
         threads = [threading.Thread(target=quick_task) for _ in range(10)]
 
@@ -257,7 +279,7 @@ class TestConcurrentExceptions:
 
         def worker(worker_id):
             try:
-                for item in tqdm(range(100)):
+                for item in tqdm(_R100):
                     if worker_id == 1 and item == 50:
                         raise ValueError("Worker 1 error")
                     if item >= 20:
@@ -282,7 +304,7 @@ class TestConcurrentExceptions:
 
         def worker():
             try:
-                for item in track(range(100)):
+                for item in track(_R100):
                     if item == 25:
                         raise RuntimeError("Test error")
             except RuntimeError:
@@ -303,7 +325,7 @@ class TestContextManagerThreading:
         count = [0]
 
         def worker():
-            with TqdmRich(range(20)) as bar:
+            with TqdmRich(_R20) as bar:
                 for item in bar:
                     count[0] += 1
 
@@ -346,14 +368,14 @@ class TestThreadLocalState:
         results = {}
 
         def worker(worker_id):
-            items = list(
-                tqdm(
+            results[worker_id] = sum(
+                1
+                for _ in tqdm(
                     range(worker_id * 10 + 10),
                     desc=f"Worker {worker_id}",
                     leave=False,
                 )
             )
-            results[worker_id] = len(items)
 
         threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
 
@@ -374,7 +396,7 @@ class TestShutdownBehavior:
         """Test that cleanup happens properly after threads."""
 
         def worker():
-            list(tqdm(range(20), leave=False))
+            list(tqdm(_R20, leave=False))
 
         threads = [threading.Thread(target=worker) for _ in range(5)]
         for t in threads:
@@ -383,8 +405,8 @@ class TestShutdownBehavior:
             t.join()
 
         # Create another progress bar to ensure manager is clean
-        items = list(tqdm(range(10), leave=False))
-        assert len(items) == 10
+        count = sum(1 for _ in tqdm(_R10, leave=False))
+        assert count == 10
 
     def test_manager_state_consistency(self):
         """Test that manager maintains consistent state."""
@@ -402,5 +424,112 @@ class TestShutdownBehavior:
                 t.join()
 
         # Should still work after multiple rounds
-        items = list(tqdm(range(10), leave=False))
-        assert len(items) == 10
+        count = sum(1 for _ in tqdm(_R10, leave=False))
+        assert count == 10
+
+    def test_abandoned_bar_is_released(self):
+        """Test that an abandoned bar still stops the shared display."""
+        bar = tqdm(_R10)
+        next(bar)
+        del bar
+        gc.collect()
+
+        assert tqdm_rich._manager._active_count == 0
+        assert tqdm_rich._manager._render_thread is None
+
+    @pytest.mark.rich_render
+    def test_render_thread_lifecycle(self):
+        """Test that the render thread only runs while bars are active."""
+        for _ in tqdm(range(3), leave=False):
+            thread = tqdm_rich._manager._render_thread
+            assert thread is not None
+            assert thread.is_alive()
+
+        assert tqdm_rich._manager._render_thread is None
+        assert not thread.is_alive()
+
+
+@pytest.mark.rich_render
+class TestBackgroundRendering:
+    """Test that progress reaches Rich through the render thread."""
+
+    def test_render_thread_syncs_track(self):
+        """Test that track() counts are copied into the Rich task."""
+        for item in track(_R10):
+            if item == 4:
+                time.sleep(tqdm_rich._REFRESH_INTERVAL * 3)
+                progress = tqdm_rich._manager._progress
+                assert progress.tasks[-1].completed == 4
+                break
+
+    def test_render_thread_syncs_counter(self):
+        """Test that iteration counts are copied into the Rich task."""
+        bar = tqdm(_R10)
+        for item in bar:
+            if item == 4:
+                time.sleep(tqdm_rich._REFRESH_INTERVAL * 3)
+                task = bar._progress._tasks[bar._task_id]
+                # Item 4 is still being processed, so four are completed
+                assert task.completed == 4
+                break
+
+    def test_reset_resyncs_task(self):
+        """Test that a count matching the pre-reset one is still rendered."""
+        bar = tqdm(_R20)
+        for item in bar:
+            if item == 5:
+                time.sleep(tqdm_rich._REFRESH_INTERVAL * 3)
+                bar.reset()
+            if item == 10:
+                time.sleep(tqdm_rich._REFRESH_INTERVAL * 3)
+                # Five items done since the reset, as many as before it
+                assert bar._count() == 5
+                assert bar._progress._tasks[bar._task_id].completed == 5
+                break
+
+    def test_frame_clock(self):
+        """Test that Rich reads one timestamp per render pass."""
+        manager = tqdm_rich._ProgressManager()
+        manager._frame_time = 42.0
+        assert manager._get_time() == 42.0
+
+        manager._frame_time = None
+        before = time.monotonic()
+        assert manager._get_time() >= before
+
+    def test_progress_uses_injected_console(self, shared_console):
+        """Test that the shared Progress renders to the manager's Console."""
+        for _ in tqdm(_R1):
+            assert tqdm_rich._manager._progress.console is shared_console
+
+    def test_closed_bars_removed_by_render_pass(self):
+        """Test that leave=False bars are swept from the display."""
+        for _ in tqdm(_R1, desc="Outer"):
+            for _ in tqdm(range(3), desc="Inner", leave=False):
+                pass
+            time.sleep(tqdm_rich._REFRESH_INTERVAL * 3)
+            progress = tqdm_rich._manager._progress
+            assert [task.description for task in progress.tasks] == ["[white]Outer"]
+
+    def test_late_close_leaves_newer_bar_synced(self):
+        """Test that closing a finished bar does not unwatch a reused task id."""
+        bar = tqdm(range(3))
+        consume(bar)
+
+        bar2 = tqdm(_R100)
+        for item in bar2:
+            if item == 1:
+                # The new Progress hands bar2 the same task id bar had
+                bar.close()
+            if item == 50:
+                time.sleep(tqdm_rich._REFRESH_INTERVAL * 3)
+                assert bar2._progress._tasks[bar2._task_id].completed == 50
+                break
+
+    def test_close_after_transient_iteration(self):
+        """Test that closing a finished leave=False bar is harmless."""
+        bar = tqdm(_R5, leave=False)
+        for _ in bar:
+            pass
+        bar.close()
+        assert not tqdm_rich._manager._retired
@@ -9,10 +9,43 @@ This test suite covers:
 - Error handling in track()
 """
 
+import time
+from itertools import islice, product
+
 import pytest
 
+import tqdm_rich
 from tqdm_rich import track
 
+_R0, _R1, _R5, _R10, _R100 = range(0), range(1), range(5), range(10), range(100)
+
+_LONG_DESC = "This is a very long description " * 10
+_UNICODE_DESC = "处理中 🚀"
+
+
+def _empty_gen():
+    return
+    yield  # Never reached
+
+
+def _gen(n):
+    """
+    Yield 0..n-1 from a generator function.
+
+    Only needed where generator semantics are under test; a range iterator
+    such as ``iter(range(n))`` is enough when an iterable without __len__
+    will do.
+    """
+    yield from range(n)
+
+
+def _failing_gen(n, fail_at):
+    """Yield 0..n-1, raising RuntimeError when reaching ``fail_at``."""
+    for i in range(n):
+        if i == fail_at:
+            raise RuntimeError("Generator failed")
+        yield i
+
 
 class TestTrackBasic:
     """Test basic track() functionality."""
@@ -20,7 +53,7 @@ class TestTrackBasic:
     def test_track_list(self):
         """Test track with a simple list."""
         items = []
-        for item in track(range(10), description="Test"):
+        for item in track(_R10, description="Test"):
             items.append(item)
 
         assert len(items) == 10
@@ -29,20 +62,20 @@ class TestTrackBasic:
     def test_track_iteration(self):
         """Test basic iteration with track."""
         count = 0
-        for _ in track(range(100), description="Count"):
+        for _ in track(_R100, description="Count"):
             count += 1
 
         assert count == 100
 
     def test_track_with_description(self):
         """Test track with custom description."""
-        items = list(track(range(5), description="Custom"))
-        assert len(items) == 5
+        count = sum(1 for _ in track(_R5, description="Custom"))
+        assert count == 5
 
     def test_track_default_description(self):
         """Test track with default description."""
-        items = list(track(range(5)))
-        assert len(items) == 5
+        count = sum(1 for _ in track(_R5))
+        assert count == 5
 
 
 class TestTrackWithTotal:
@@ -50,22 +83,19 @@ class TestTrackWithTotal:
 
     def test_track_with_explicit_total(self):
         """Test track with explicit total parameter."""
-        items = []
-        for item in track(range(10), total=10):
-            items.append(item)
-
-        assert len(items) == 10
+        count = sum(1 for _ in track(_R10, total=10))
+        assert count == 10
 
     def test_track_total_detection(self):
         """Test track auto-detects total from list."""
-        items = list(track([1, 2, 3, 4, 5]))
-        assert len(items) == 5
+        count = sum(1 for _ in track([1, 2, 3, 4, 5]))
+        assert count == 5
 
     def test_track_total_mismatch(self):
         """Test track with incorrect total."""
         # Should still iterate all items even if total is wrong
-        items = list(track(range(10), total=5))
-        assert len(items) == 10
+        count = sum(1 for _ in track(_R10, total=5))
+        assert count == 10
 
 
 class TestTrackGenerator:
@@ -73,30 +103,20 @@ class TestTrackGenerator:
 
     def test_track_generator(self):
         """Test track with a generator function."""
-
-        def gen():
-            for i in range(10):
-                yield i
-
-        items = list(track(gen()))
+        items = list(track(_gen(10)))
         assert len(items) == 10
         assert items == list(range(10))
 
     def test_track_generator_expression(self):
         """Test track with a generator expression."""
         gen_expr = (i for i in range(10))
-        items = list(track(gen_expr))
-        assert len(items) == 10
-
-    def test_track_generator_without_total(self):
-        """Test track with generator without total."""
+        count = sum(1 for _ in track(gen_expr))
+        assert count == 10
 
-        def gen():
-            for i in range(5):
-                yield i
-
-        items = list(track(gen(), description="Generator"))
-        assert len(items) == 5
+    def test_track_unsized_without_total(self):
+        """Test track with an unsized iterable and no total."""
+        count = sum(1 for _ in track(iter(_R5), description="Unsized"))
+        assert count == 5
 
 
 class TestTrackLogarithmicMode:
@@ -104,34 +124,24 @@ class TestTrackLogarithmicMode:
 
     def test_track_log_mode_explicit(self):
         """Test track with explicit log parameter."""
-
-        def slow_gen():
-            for i in range(100):
-                yield i
-
-        items = list(track(slow_gen(), log=20))
-        assert len(items) == 100
+        count = sum(1 for _ in track(iter(_R100), log=20))
+        assert count == 100
 
     def test_track_log_mode_default(self):
-        """Test track with default log mode for generators."""
-
-        def gen():
-            for i in range(50):
-                yield i
-
-        # Generator without total should use log mode
-        items = list(track(gen()))
-        assert len(items) == 50
+        """Test track with default log mode for unsized iterables."""
+        # An unsized iterable without total should use log mode
+        count = sum(1 for _ in track(iter(range(50))))
+        assert count == 50
 
     def test_track_log_mode_float(self):
         """Test track with float log parameter."""
-        items = list(track(range(100), log=15.5))
-        assert len(items) == 100
+        count = sum(1 for _ in track(_R100, log=15.5))
+        assert count == 100
 
     def test_track_log_mode_large(self):
         """Test track with large log parameter."""
-        items = list(track(range(100), log=100))
-        assert len(items) == 100
+        count = sum(1 for _ in track(_R100, log=100))
+        assert count == 100
 
 
 class TestTrackTransient:
@@ -139,53 +149,45 @@ class TestTrackTransient:
 
     def test_track_transient_true(self):
         """Test track with transient=True."""
-        items = list(track(range(10), transient=True))
-        assert len(items) == 10
+        count = sum(1 for _ in track(_R10, transient=True))
+        assert count == 10
 
     def test_track_transient_false(self):
         """Test track with transient=False (default)."""
-        items = list(track(range(10), transient=False))
-        assert len(items) == 10
+        count = sum(1 for _ in track(_R10, transient=False))
+        assert count == 10
 
     def test_track_transient_default(self):
         """Test track with default transient (should be False)."""
-        items = list(track(range(10)))
-        assert len(items) == 10
+        count = sum(1 for _ in track(_R10))
+        assert count == 10
 
 
+@pytest.mark.xdist_group("rich_live")
 class TestTrackErrorHandling:
     """Test error handling in track()."""
 
-    def test_track_exception_during_iteration(self):
-        """Test that exceptions during iteration are propagated."""
-        with pytest.raises(ValueError):
-            for item in track(range(100)):
-                if item == 50:
-                    raise ValueError("Test error")
+    @pytest.mark.parametrize(
+        "exc, idx",
+        [(ValueError, 50), (RuntimeError, 30), (KeyboardInterrupt, 25)],
+        ids=["value_error", "runtime_error", "keyboard_interrupt"],
+    )
+    def test_track_exception_paths(self, exc, idx):
+        """Test that an exception raised in the loop body propagates."""
+        with pytest.raises(exc):
+            for item in track(_R100):
+                if item == idx:
+                    raise exc("Test error")
 
     def test_track_exception_in_generator(self):
         """Test track with generator that raises exception."""
-
-        def failing_gen():
-            for i in range(100):
-                if i == 30:
-                    raise RuntimeError("Generator failed")
-                yield i
-
         with pytest.raises(RuntimeError):
-            list(track(failing_gen()))
-
-    def test_track_keyboard_interrupt(self):
-        """Test handling of KeyboardInterrupt in track."""
-        with pytest.raises(KeyboardInterrupt):
-            for item in track(range(100)):
-                if item == 25:
-                    raise KeyboardInterrupt()
+            list(track(_failing_gen(100, 30)))
 
     def test_track_break_iteration(self):
         """Test breaking out of track iteration."""
         count = 0
-        for item in track(range(100)):
+        for item in track(_R100):
             count += 1
             if item == 10:
                 break
@@ -193,65 +195,43 @@ class TestTrackErrorHandling:
         assert count == 11
 
 
-class TestTrackEmptyIterables:
-    """Test track with empty iterables."""
-
-    def test_track_empty_list(self):
-        """Test track with empty list."""
-        items = list(track([], description="Empty"))
-        assert items == []
-
-    def test_track_empty_range(self):
-        """Test track with empty range."""
-        items = list(track(range(0)))
-        assert items == []
-
-    def test_track_empty_generator(self):
-        """Test track with empty generator."""
+@pytest.mark.noop
+class TestTrackTrivialIterables:
+    """Test track with empty and single-item iterables."""
 
-        def empty_gen():
-            return
-            yield  # Never reached
-
-        items = list(track(empty_gen()))
-        assert items == []
-
-
-class TestTrackSingleItem:
-    """Test track with single items."""
-
-    def test_track_single_item_list(self):
-        """Test track with single item list."""
-        items = list(track([42]))
-        assert items == [42]
-
-    def test_track_single_item_range(self):
-        """Test track with single item range."""
-        items = list(track(range(1)))
-        assert items == [0]
+    # Factories rather than values, since a generator can only be drained once
+    @pytest.mark.parametrize(
+        "make, expected",
+        [
+            (list, []),
+            (lambda: _R0, []),
+            (_empty_gen, []),
+            (lambda: [42], [42]),
+            (lambda: _R1, [0]),
+        ],
+        ids=["empty_list", "empty_range", "empty_gen", "single_list", "single_range"],
+    )
+    def test_track_trivial_iterables(self, make, expected):
+        """Test track over zero or one items."""
+        assert list(track(make())) == expected
 
 
 class TestTrackLargeIterables:
     """Test track with large iterables."""
 
-    def test_track_large_range(self):
+    def test_track_large_range(self, big_range):
         """Test track with large range."""
         count = 0
-        for _ in track(range(10000), description="Large"):
+        for _ in track(big_range[:150], description="Large"):
             count += 1
             if count >= 100:
                 break
         assert count == 100
 
-    def test_track_large_with_log(self):
+    def test_track_large_with_log(self, big_range):
         """Test track with large range in log mode."""
-
-        def large_gen():
-            for i in range(10000):
-                yield i
-
         count = 0
-        for _ in track(large_gen(), log=50):
+        for _ in track(islice(big_range, 150), log=50):
             count += 1
             if count >= 100:
                 break
@@ -263,57 +243,49 @@ class TestTrackDescriptions:
 
     def test_track_custom_description(self):
         """Test track with custom description."""
-        items = list(track(range(5), description="Processing items"))
-        assert len(items) == 5
+        count = sum(1 for _ in track(_R5, description="Processing items"))
+        assert count == 5
 
     def test_track_empty_description(self):
         """Test track with empty description."""
-        items = list(track(range(5), description=""))
-        assert len(items) == 5
+        count = sum(1 for _ in track(_R5, description=""))
+        assert count == 5
 
     def test_track_long_description(self):
         """Test track with very long description."""
-        long_desc = "This is a very long description " * 10
-        items = list(track(range(5), description=long_desc))
-        assert len(items) == 5
+        count = sum(1 for _ in track(_R5, description=_LONG_DESC))
+        assert count == 5
 
     def test_track_unicode_description(self):
         """Test track with unicode description."""
-        items = list(track(range(5), description="处理中 🚀"))
-        assert len(items) == 5
+        count = sum(1 for _ in track(_R5, description=_UNICODE_DESC))
+        assert count == 5
 
     def test_track_special_chars_description(self):
         """Test track with special characters in description."""
-        items = list(track(range(5), description="[Progress] 50%"))
-        assert len(items) == 5
+        count = sum(1 for _ in track(_R5, description="[Progress] 50%"))
+        assert count == 5
 
 
+@pytest.mark.noop
 class TestTrackTypePreservation:
     """Test that track preserves item types."""
 
-    def test_track_string_items(self):
-        """Test track with string items."""
-        items = list(track(["a", "b", "c"]))
-        assert items == ["a", "b", "c"]
-        assert all(isinstance(i, str) for i in items)
-
-    def test_track_mixed_types(self):
-        """Test track with mixed types."""
-        data = [1, "two", 3.0, None, [5]]
+    @pytest.mark.parametrize(
+        "data",
+        [
+            ["a", "b", "c"],
+            [1, "two", 3.0, None, [5]],
+            [(1, 2), (3, 4), (5, 6)],
+            [{"a": 1}, {"b": 2}],
+        ],
+        ids=["str", "mixed", "tuple", "dict"],
+    )
+    def test_track_preserves_items(self, data):
+        """Test that track yields the items unchanged."""
         items = list(track(data))
         assert items == data
-
-    def test_track_tuple_items(self):
-        """Test track with tuple items."""
-        tuples = [(1, 2), (3, 4), (5, 6)]
-        items = list(track(tuples))
-        assert items == tuples
-
-    def test_track_dict_items(self):
-        """Test track with dict items."""
-        dicts = [{"a": 1}, {"b": 2}]
-        items = list(track(dicts))
-        assert items == dicts
+        assert all(a is b for a, b in zip(items, data))
 
 
 class TestTrackCombinations:
@@ -321,75 +293,66 @@ class TestTrackCombinations:
 
     def test_track_all_parameters(self):
         """Test track with all parameters specified."""
-        items = list(
-            track(
-                range(10),
+        count = sum(
+            1
+            for _ in track(
+                _R10,
                 description="Full",
                 total=10,
                 log=None,
                 transient=False,
             )
         )
-        assert len(items) == 10
+        assert count == 10
 
     def test_track_log_with_explicit_total(self):
         """Test track with both log and total specified."""
-        items = list(track(range(10), total=10, log=20))
-        assert len(items) == 10
+        count = sum(1 for _ in track(_R10, total=10, log=20))
+        assert count == 10
 
     def test_track_log_and_transient(self):
         """Test track with log mode and transient."""
+        count = sum(1 for _ in track(iter(range(50)), log=20, transient=True))
+        assert count == 50
 
-        def gen():
-            for i in range(50):
-                yield i
 
-        items = list(track(gen(), log=20, transient=True))
-        assert len(items) == 50
+_DATA = {"a": 1, "b": 2, "c": 3}
 
 
+@pytest.mark.noop
 class TestTrackIterableVariations:
     """Test track with various iterable types."""
 
-    def test_track_tuple(self):
-        """Test track with tuple."""
-        data = (1, 2, 3, 4, 5)
-        items = list(track(data))
-        assert items == list(data)
-
-    def test_track_set(self):
-        """Test track with set."""
-        data = {1, 2, 3, 4, 5}
-        items = list(track(data))
-        assert len(items) == 5
-        assert set(items) == data
-
-    def test_track_dict_keys(self):
-        """Test track with dict keys."""
-        data = {"a": 1, "b": 2, "c": 3}
-        items = list(track(data.keys()))
-        assert set(items) == set(data.keys())
-
-    def test_track_dict_values(self):
-        """Test track with dict values."""
-        data = {"a": 1, "b": 2, "c": 3}
-        items = list(track(data.values()))
-        assert sorted(items) == sorted(data.values())
-
-    def test_track_enumerate(self):
-        """Test track with enumerate."""
-        data = ["a", "b", "c"]
-        items = list(track(enumerate(data)))
-        assert items == list(enumerate(data))
-
-    def test_track_zip(self):
-        """Test track with zip."""
-        data1 = [1, 2, 3]
-        data2 = ["a", "b", "c"]
-        items = list(track(zip(data1, data2)))
-        assert items == list(zip(data1, data2))
-
-
+    # Factories rather than values, since enumerate and zip are one-shot
+    @pytest.mark.parametrize(
+        "make",
+        [
+            lambda: (1, 2, 3, 4, 5),
+            lambda: {1, 2, 3, 4, 5},
+            _DATA.keys,
+            _DATA.values,
+            lambda: enumerate(["a", "b", "c"]),
+            lambda: zip([1, 2, 3], ["a", "b", "c"]),
+        ],
+        ids=["tuple", "set", "dict_keys", "dict_values", "enumerate", "zip"],
+    )
+    def test_track_iterable(self, make):
+        """Test that track yields what plain iteration would."""
+        assert list(track(make())) == list(make())
+
+
+class TestTrackNoopMode:
+    """Test track() under the TQDM_RICH_NOOP pass-through mode."""
+
+    def test_noop_track_passes_items_through(self, monkeypatch):
+        """Test that track() yields items without starting a display."""
+        monkeypatch.setattr(tqdm_rich, "_NOOP", True)
+        for item in track(iter(range(3))):
+            assert tqdm_rich._manager._progress is None
+        assert item == 2
+
+
+@pytest.mark.noop
 class TestTrackYield:
     """Test that track properly yields all items."""
 
@@ -401,13 +364,8 @@ class TestTrackYield:
 
     def test_track_generator_yields_once(self):
         """Test that generator items are yielded only once."""
-
-        def gen():
-            for i in range(10):
-                yield i
-
-        items1 = list(track(gen()))
-        items2 = list(gen())
+        items1 = list(track(_gen(10)))
+        items2 = list(_gen(10))
 
         assert items1 == items2
 
@@ -415,13 +373,25 @@ class TestTrackYield:
 class TestTrackNesting:
     """Test nested track calls."""
 
+    @pytest.mark.rich_render
     def test_nested_track(self):
-        """Test nested track calls."""
+        """Test nested track calls with transient inner bars."""
         count = 0
-        for i in track(range(5)):
-            for j in track(range(5), transient=True):
+        for i in track(_R5, description="Outer"):
+            for j in track(_R5, description="Inner", transient=True):
                 count += 1
+            if i == 0:
+                # The next render pass removes the finished inner bar while
+                # the outer one keeps the display up
+                time.sleep(tqdm_rich._REFRESH_INTERVAL * 3)
+                progress = tqdm_rich._manager._progress
+                assert [task.description for task in progress.tasks] == ["[white]Outer"]
+
+        assert count == 25
 
+    def test_track_flattened_nesting(self):
+        """Test one bar over the flattened iteration space of a nested loop."""
+        count = sum(1 for _ in track(product(_R5, _R5)))
         assert count == 25
 
     def test_track_in_function(self):
@@ -433,5 +403,5 @@ class TestTrackNesting:
                 results.append(item * 2)
             return results
 
-        results = process(range(5))
+        results = process(_R5)
         assert results == [0, 2, 4, 6, 8]